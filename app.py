@@ -117,7 +117,7 @@ def join_club(club_id):
                 request_id = db.create_join_request(club_id, student_name, email, phone, year, department, reason)
                 
                 if request_id:
-                    flash(f'✅ Your request to join {club["name"]} has been submitted successfully!', 'success')
+                    flash(f'✅ Your request to join {club.name} has been submitted successfully!', 'success')
                     return redirect(url_for('join_success', club_id=club_id))
                 else:
                     flash('Failed to submit join request. Please try again.', 'danger')
@@ -0,0 +1,133 @@
+"""Benchmark typed row objects against the old per-row dicts.
+
+Fills a throwaway database with synthetic clubs, members and events, then
+compares the old ``SELECT *`` + ``dict(row)`` listing queries with the
+current helpers in database.py: memory retained by the fetched rows and
+how many listings per second each approach can build.
+
+Usage:
+    python bench_rows.py               # 5000 clubs
+    python bench_rows.py --clubs 20000 --repeat 20
+"""
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+import database as db
+
+OLD_QUERIES = {
+    'clubs listing': """
+        SELECT c.*, COUNT(DISTINCT m.id) as actual_member_count
+        FROM clubs c
+        LEFT JOIN members m ON c.id = m.club_id
+        GROUP BY c.id
+        ORDER BY c.name
+    """,
+    'events listing': """
+        SELECT e.*, c.name as club_name, c.category
+        FROM events e
+        JOIN clubs c ON e.club_id = c.id
+        WHERE e.status = 'upcoming'
+        ORDER BY e.event_date, e.event_time
+    """,
+}
+
+NEW_HELPERS = {
+    'clubs listing': db.get_all_clubs,
+    'events listing': db.get_all_upcoming_events,
+}
+
+# ═══════════════════════════════════════════════════════
+# SETUP
+# ═══════════════════════════════════════════════════════
+
+def populate(clubs):
+    """Insert synthetic rows on top of the sample data"""
+    long_text = "Long-form club description shown only on the detail page. " * 20
+    with db.get_db() as conn:
+        cursor = conn.cursor()
+        cursor.executemany("""
+            INSERT INTO clubs (name, category, description, full_description, meeting_time,
+                               meeting_location, contact_email, president_name, founded_year, member_count)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, [(f'Club {i:06d}', f'Category {i % 12}', 'Short card description',
+               long_text, 'Every Friday, 4:00 PM', 'Room 101', f'club{i}@college.edu',
+               'Some President', 2000 + i % 25, 40) for i in range(clubs)])
+        cursor.execute("SELECT id FROM clubs")
+        club_ids = [row[0] for row in cursor.fetchall()]
+        cursor.executemany("""
+            INSERT INTO members (club_id, name, role, year, department, email, joined_date)
+            VALUES (?, ?, 'Member', 'Second Year', 'Computer Science', 'm@college.edu', '2024-08-01')
+        """, [(club_id, f'Member {n}') for club_id in club_ids for n in range(3)])
+        cursor.executemany("""
+            INSERT INTO events (club_id, title, description, event_date, event_time, location, status)
+            VALUES (?, ?, ?, '2026-02-15', '9:00 AM', 'Main Auditorium', 'upcoming')
+        """, [(club_id, f'Event for club {club_id}', long_text) for club_id in club_ids])
+
+# ═══════════════════════════════════════════════════════
+# MEASUREMENTS
+# ═══════════════════════════════════════════════════════
+
+def fetch_old(sql):
+    """The previous approach: sqlite3.Row -> dict for every row"""
+    with db.get_db() as conn:
+        cursor = conn.cursor()
+        cursor.execute(sql)
+        return [dict(row) for row in cursor.fetchall()]
+
+def retained_bytes(fetch):
+    """Bytes still allocated by the result of fetch()"""
+    tracemalloc.start()
+    rows = fetch()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del rows
+    return size
+
+def listings_per_second(old, new, repeat):
+    """Time both approaches, alternating runs so neither gets a warmer cache"""
+    elapsed = {old: 0.0, new: 0.0}
+    for i in range(repeat):
+        for fetch in ((old, new) if i % 2 == 0 else (new, old)):
+            start = time.perf_counter()
+            fetch()
+            elapsed[fetch] += time.perf_counter() - start
+    return repeat / elapsed[old], repeat / elapsed[new]
+
+# ═══════════════════════════════════════════════════════
+# MAIN
+# ═══════════════════════════════════════════════════════
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare typed rows with per-row dicts")
+    parser.add_argument('--clubs', type=int, default=5000, help="synthetic clubs to insert")
+    parser.add_argument('--repeat', type=int, default=10, help="listings per throughput run")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db.DB_PATH = os.path.join(tmp, 'bench.db')
+        db.init_database()
+        populate(args.clubs)
+
+        print(f"📊 {args.clubs} synthetic clubs, {args.repeat} listings per run")
+        print("=" * 50)
+        for name, sql in OLD_QUERIES.items():
+            old = lambda: fetch_old(sql)
+            new = NEW_HELPERS[name]
+
+            # Warm the SQLite page cache and allocator before measuring
+            old()
+            new()
+
+            old_mem, new_mem = retained_bytes(old), retained_bytes(new)
+            old_rate, new_rate = listings_per_second(old, new, args.repeat)
+
+            print(f"\n{name}")
+            print(f"   dict rows:  {old_mem / 1024:10.1f} KiB  {old_rate:8.1f} listings/s")
+            print(f"   typed rows: {new_mem / 1024:10.1f} KiB  {new_rate:8.1f} listings/s")
+            print(f"   memory: {old_mem / new_mem:.1f}x smaller, throughput: {new_rate / old_rate:.2f}x")
+
+if __name__ == '__main__':
+    main()
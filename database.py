@@ -1,10 +1,16 @@
 import sqlite3
 from contextlib import contextmanager
 import os
+from models import Club, ClubSummary, Member, Event, GalleryPhoto
 
 # Database file path
 DB_PATH = os.path.join(os.path.dirname(__file__), 'college_clubs.db')
 
+# Number of query helper calls that failed and returned an empty result.
+# Batch jobs (prerender.py) compare it before and after a run to tell
+# "no rows" apart from "the query failed".
+query_error_count = 0
+
 # ═══════════════════════════════════════════════════════
 # CONNECTION MANAGEMENT
 # ═══════════════════════════════════════════════════════
@@ -35,6 +41,18 @@ def get_db():
     finally:
         conn.close()
 
+def log_query_error(helper, error):
+    """Report a failed query helper call and count it"""
+    global query_error_count
+    query_error_count += 1
+    print(f"Error in {helper}: {error}")
+
+def typed_cursor(conn, row_type):
+    """Cursor that builds row_type tuples directly instead of sqlite3.Row objects"""
+    cursor = conn.cursor()
+    cursor.row_factory = lambda _cursor, row: row_type(*row)
+    return cursor
+
 # ═══════════════════════════════════════════════════════
 # DATABASE INITIALIZATION
 # ═══════════════════════════════════════════════════════
@@ -213,49 +231,52 @@ def get_all_clubs():
     """Get all clubs with member count"""
     try:
         with get_db() as conn:
-            cursor = conn.cursor()
+            cursor = typed_cursor(conn, ClubSummary)
             cursor.execute("""
-                SELECT c.*, COUNT(DISTINCT m.id) as actual_member_count
+                SELECT c.id, c.name, c.category, c.description, c.founded_year, c.member_count,
+                       COUNT(DISTINCT m.id) as actual_member_count
                 FROM clubs c
                 LEFT JOIN members m ON c.id = m.club_id
                 GROUP BY c.id
                 ORDER BY c.name
             """)
-            clubs = [dict(row) for row in cursor.fetchall()]
+            clubs = cursor.fetchall()
             return clubs
     except Exception as e:
-        print(f"Error in get_all_clubs: {e}")
+        log_query_error('get_all_clubs', e)
         return []
 
 def get_clubs_by_category(category):
     """Get clubs filtered by category"""
     try:
         with get_db() as conn:
-            cursor = conn.cursor()
+            cursor = typed_cursor(conn, ClubSummary)
             cursor.execute("""
-                SELECT c.*, COUNT(DISTINCT m.id) as member_count
-                FROM clubs c
-                LEFT JOIN members m ON c.id = m.club_id
-                WHERE c.category = ?
-                GROUP BY c.id
-                ORDER BY c.name
+                SELECT id, name, category, description, founded_year, member_count
+                FROM clubs
+                WHERE category = ?
+                ORDER BY name
             """, (category,))
-            clubs = [dict(row) for row in cursor.fetchall()]
+            clubs = cursor.fetchall()
             return clubs
     except Exception as e:
-        print(f"Error in get_clubs_by_category: {e}")
+        log_query_error('get_clubs_by_category', e)
         return []
 
 def get_club_by_id(club_id):
     """Get single club by ID"""
     try:
         with get_db() as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM clubs WHERE id = ?", (club_id,))
-            row = cursor.fetchone()
-            return dict(row) if row else None
+            cursor = typed_cursor(conn, Club)
+            cursor.execute("""
+                SELECT id, name, category, description, full_description, logo,
+                       meeting_time, meeting_location, contact_email, contact_phone,
+                       president_name, founded_year, member_count, created_at
+                FROM clubs WHERE id = ?
+            """, (club_id,))
+            return cursor.fetchone()
     except Exception as e:
-        print(f"Error in get_club_by_id: {e}")
+        log_query_error('get_club_by_id', e)
         return None
 
 def get_all_categories():
@@ -267,7 +288,7 @@ def get_all_categories():
             categories = [row[0] for row in cursor.fetchall()]
             return categories
     except Exception as e:
-        print(f"Error in get_all_categories: {e}")
+        log_query_error('get_all_categories', e)
         return []
 
 def get_club_stats():
@@ -291,7 +312,7 @@ def get_club_stats():
                 'upcoming_events': upcoming_events
             }
     except Exception as e:
-        print(f"Error in get_club_stats: {e}")
+        log_query_error('get_club_stats', e)
         return {'total_clubs': 0, 'total_members': 0, 'upcoming_events': 0}
 
 # ═══════════════════════════════════════════════════════
@@ -302,9 +323,10 @@ def get_club_members(club_id):
     """Get all members of a club"""
     try:
         with get_db() as conn:
-            cursor = conn.cursor()
+            cursor = typed_cursor(conn, Member)
             cursor.execute("""
-                SELECT * FROM members 
+                SELECT id, club_id, name, role, year, department
+                FROM members
                 WHERE club_id = ?
                 ORDER BY 
                     CASE role
@@ -315,10 +337,10 @@ def get_club_members(club_id):
                         ELSE 5
                     END, name
             """, (club_id,))
-            members = [dict(row) for row in cursor.fetchall()]
+            members = cursor.fetchall()
             return members
     except Exception as e:
-        print(f"Error in get_club_members: {e}")
+        log_query_error('get_club_members', e)
         return []
 
 # ═══════════════════════════════════════════════════════
@@ -329,35 +351,37 @@ def get_all_upcoming_events():
     """Get all upcoming events with club information"""
     try:
         with get_db() as conn:
-            cursor = conn.cursor()
+            cursor = typed_cursor(conn, Event)
             cursor.execute("""
-                SELECT e.*, c.name as club_name, c.category
+                SELECT e.id, e.club_id, e.title, e.description, e.event_date, e.event_time,
+                       e.location, c.name as club_name, c.category
                 FROM events e
                 JOIN clubs c ON e.club_id = c.id
                 WHERE e.status = 'upcoming'
                 ORDER BY e.event_date, e.event_time
             """)
-            events = [dict(row) for row in cursor.fetchall()]
+            events = cursor.fetchall()
             return events
     except Exception as e:
-        print(f"Error in get_all_upcoming_events: {e}")
+        log_query_error('get_all_upcoming_events', e)
         return []
 
 def get_club_events(club_id, limit=5):
     """Get upcoming events for a specific club"""
     try:
         with get_db() as conn:
-            cursor = conn.cursor()
+            cursor = typed_cursor(conn, Event)
             cursor.execute("""
-                SELECT * FROM events 
+                SELECT id, club_id, title, description, event_date, event_time, location
+                FROM events
                 WHERE club_id = ? AND status = 'upcoming'
                 ORDER BY event_date
                 LIMIT ?
             """, (club_id, limit))
-            events = [dict(row) for row in cursor.fetchall()]
+            events = cursor.fetchall()
             return events
     except Exception as e:
-        print(f"Error in get_club_events: {e}")
+        log_query_error('get_club_events', e)
         return []
 
 # ═══════════════════════════════════════════════════════
@@ -368,38 +392,39 @@ def get_club_gallery(club_id, limit=12):
     """Get gallery photos for a specific club"""
     try:
         with get_db() as conn:
-            cursor = conn.cursor()
+            cursor = typed_cursor(conn, GalleryPhoto)
             cursor.execute("""
-                SELECT eg.*, e.title as event_title
+                SELECT eg.id, eg.event_id, eg.image_path, eg.caption, e.title as event_title
                 FROM event_gallery eg
                 JOIN events e ON eg.event_id = e.id
                 WHERE e.club_id = ?
                 ORDER BY eg.uploaded_at DESC
                 LIMIT ?
             """, (club_id, limit))
-            gallery = [dict(row) for row in cursor.fetchall()]
+            gallery = cursor.fetchall()
             return gallery
     except Exception as e:
-        print(f"Error in get_club_gallery: {e}")
+        log_query_error('get_club_gallery', e)
         return []
 
 def get_all_gallery_photos(limit=50):
     """Get all gallery photos from all clubs"""
     try:
         with get_db() as conn:
-            cursor = conn.cursor()
+            cursor = typed_cursor(conn, GalleryPhoto)
             cursor.execute("""
-                SELECT eg.*, e.title as event_title, c.name as club_name
+                SELECT eg.id, eg.event_id, eg.image_path, eg.caption,
+                       e.title as event_title, c.name as club_name
                 FROM event_gallery eg
                 JOIN events e ON eg.event_id = e.id
                 JOIN clubs c ON e.club_id = c.id
                 ORDER BY eg.uploaded_at DESC
                 LIMIT ?
             """, (limit,))
-            photos = [dict(row) for row in cursor.fetchall()]
+            photos = cursor.fetchall()
             return photos
     except Exception as e:
-        print(f"Error in get_all_gallery_photos: {e}")
+        log_query_error('get_all_gallery_photos', e)
         return []
 
 # ═══════════════════════════════════════════════════════
@@ -417,7 +442,7 @@ def create_join_request(club_id, student_name, email, phone, year, department, r
             """, (club_id, student_name, email, phone, year, department, reason))
             return cursor.lastrowid
     except Exception as e:
-        print(f"Error in create_join_request: {e}")
+        log_query_error('create_join_request', e)
         return None
 
 # ═══════════════════════════════════════════════════════
@@ -428,40 +453,39 @@ def search_clubs(query):
     """Search clubs by name or description"""
     try:
         with get_db() as conn:
-            cursor = conn.cursor()
+            cursor = typed_cursor(conn, ClubSummary)
             search_pattern = f"%{query}%"
             cursor.execute("""
-                SELECT c.*, COUNT(DISTINCT m.id) as member_count
-                FROM clubs c
-                LEFT JOIN members m ON c.id = m.club_id
-                WHERE c.name LIKE ? OR c.description LIKE ? OR c.category LIKE ?
-                GROUP BY c.id
-                ORDER BY c.name
+                SELECT id, name, category, description, founded_year, member_count
+                FROM clubs
+                WHERE name LIKE ? OR description LIKE ? OR category LIKE ?
+                ORDER BY name
             """, (search_pattern, search_pattern, search_pattern))
-            clubs = [dict(row) for row in cursor.fetchall()]
+            clubs = cursor.fetchall()
             return clubs
     except Exception as e:
-        print(f"Error in search_clubs: {e}")
+        log_query_error('search_clubs', e)
         return []
 
 def search_events(query):
     """Search events by title or description"""
     try:
         with get_db() as conn:
-            cursor = conn.cursor()
+            cursor = typed_cursor(conn, Event)
             search_pattern = f"%{query}%"
             cursor.execute("""
-                SELECT e.*, c.name as club_name, c.category
+                SELECT e.id, e.club_id, e.title, e.description, e.event_date, e.event_time,
+                       e.location, c.name as club_name, c.category
                 FROM events e
                 JOIN clubs c ON e.club_id = c.id
                 WHERE (e.title LIKE ? OR e.description LIKE ?) 
                 AND e.status = 'upcoming'
                 ORDER BY e.event_date
             """, (search_pattern, search_pattern))
-            events = [dict(row) for row in cursor.fetchall()]
+            events = cursor.fetchall()
             return events
     except Exception as e:
-        print(f"Error in search_events: {e}")
+        log_query_error('search_events', e)
         return []
 
 # ═══════════════════════════════════════════════════════
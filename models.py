@@ -0,0 +1,94 @@
+"""Typed row objects returned by the query helpers in database.py.
+
+Each row type is a NamedTuple: fields are stored in a plain tuple (no
+per-instance __dict__), and templates read them as attributes just like
+they read the old dicts. Field order matches the column order of the
+SELECT statements that build them.
+"""
+from typing import NamedTuple, Optional
+
+# ═══════════════════════════════════════════════════════
+# CLUBS
+# ═══════════════════════════════════════════════════════
+
+class Club(NamedTuple):
+    """Full club row for the detail and join pages"""
+    id: int
+    name: str
+    category: str
+    description: Optional[str]
+    full_description: Optional[str]
+    logo: Optional[str]
+    meeting_time: Optional[str]
+    meeting_location: Optional[str]
+    contact_email: Optional[str]
+    contact_phone: Optional[str]
+    president_name: Optional[str]
+    founded_year: Optional[int]
+    member_count: Optional[int]
+    created_at: Optional[str]
+
+class ClubSummary(NamedTuple):
+    """Club card shown on listing pages (no long-form text)"""
+    id: int
+    name: str
+    category: str
+    description: Optional[str]
+    founded_year: Optional[int]
+    member_count: Optional[int]
+    actual_member_count: Optional[int] = None
+
+# ═══════════════════════════════════════════════════════
+# MEMBERS, EVENTS & GALLERY
+# ═══════════════════════════════════════════════════════
+
+class Member(NamedTuple):
+    """Club member as listed on the club detail page"""
+    id: int
+    club_id: int
+    name: str
+    role: Optional[str]
+    year: Optional[str]
+    department: Optional[str]
+
+class Event(NamedTuple):
+    """Upcoming event; club_name and category are set on the events page"""
+    id: int
+    club_id: int
+    title: str
+    description: Optional[str]
+    event_date: Optional[str]
+    event_time: Optional[str]
+    location: Optional[str]
+    club_name: Optional[str] = None
+    category: Optional[str] = None
+
+class GalleryPhoto(NamedTuple):
+    """Gallery photo with its event title (and club name on the gallery page)"""
+    id: int
+    event_id: int
+    image_path: str
+    caption: Optional[str]
+    event_title: str
+    club_name: Optional[str] = None
+
+# ═══════════════════════════════════════════════════════
+# JOIN REQUESTS
+# ═══════════════════════════════════════════════════════
+
+class JoinRequest(NamedTuple):
+    """Student request to join a club.
+
+    Not returned by any helper yet: nothing reads join requests back. It
+    documents the row shape for the first page that does.
+    """
+    id: int
+    club_id: int
+    student_name: str
+    email: str
+    phone: Optional[str]
+    year: Optional[str]
+    department: Optional[str]
+    reason: Optional[str]
+    status: str
+    submitted_at: Optional[str]
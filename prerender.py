@@ -0,0 +1,273 @@
+"""Pre-render the read-only pages of the site to a static HTML tree.
+
+Pages such as the home page, club listings, club details, events and the
+gallery look the same for every visitor, so they can be rendered ahead of
+time with the Flask app and served straight from disk by the reverse proxy.
+Only /join and /search still need to reach Python.
+
+Usage:
+    python prerender.py                 # incremental build into ./build
+    python prerender.py -o /srv/clubs   # choose the output directory
+    python prerender.py --full          # ignore the manifest and re-render everything
+"""
+import argparse
+import hashlib
+import json
+import os
+
+from flask import message_flashed, url_for
+
+import database as db
+from app import app
+
+# Default output directory; the manifest tracking the previous build sits
+# next to it (build.manifest.json) so the proxy never serves it
+DEFAULT_OUTPUT = os.path.join(os.path.dirname(__file__), 'build')
+MANIFEST_SUFFIX = '.manifest.json'
+
+TEMPLATES_DIR = os.path.join(os.path.dirname(__file__), 'templates')
+STATIC_DIR = os.path.join(os.path.dirname(__file__), 'static')
+
+# Code that shapes every page; editing it invalidates the whole build
+SOURCE_FILES = [
+    os.path.join(os.path.dirname(__file__), 'app.py'),
+    os.path.join(os.path.dirname(__file__), 'database.py'),
+    os.path.join(os.path.dirname(__file__), 'models.py'),
+    os.path.abspath(__file__),
+]
+
+# ═══════════════════════════════════════════════════════
+# PAGE DISCOVERY
+# ═══════════════════════════════════════════════════════
+
+def collect_pages():
+    """Return (url, output path, data) for every page to pre-render.
+
+    ``data`` holds the rows the page is built from, fetched with the same
+    helpers the routes use, so it changes exactly when the page would.
+    """
+    categories = db.get_all_categories()
+    all_clubs = db.get_all_clubs()
+
+    pages = [
+        ('/', 'index.html', [all_clubs, db.get_club_stats()]),
+        ('/clubs', 'clubs/index.html', [categories, all_clubs]),
+        ('/events', 'events/index.html', [db.get_all_upcoming_events()]),
+        ('/gallery', 'gallery/index.html', [db.get_all_gallery_photos(limit=50)]),
+    ]
+
+    for category in categories:
+        slug = category_slug(category)
+        if slug is None:
+            print(f"⚠️  Not pre-rendering category {category!r}: Flask will serve it")
+            continue
+        pages.append((
+            f'/clubs?category={slug}',
+            f'clubs/category/{slug}/index.html',
+            [categories, db.get_clubs_by_category(category)],
+        ))
+
+    for club in all_clubs:
+        club_id = club.id
+        pages.append((
+            f'/club/{club_id}',
+            f'club/{club_id}/index.html',
+            [
+                db.get_club_by_id(club_id),
+                db.get_club_members(club_id),
+                db.get_club_events(club_id, limit=5),
+                db.get_club_gallery(club_id, limit=12),
+            ],
+        ))
+
+    return pages
+
+def category_slug(category):
+    """Return the ?category= value the templates link to for this category.
+
+    The value is used verbatim as a directory name so the proxy can map the
+    query string straight onto the file. None if it can't be one safely.
+    """
+    with app.test_request_context():
+        link = url_for('clubs_list', category=category)
+    slug = link.partition('?category=')[2]
+    if not slug or '/' in slug or '?' in slug or slug.startswith('.'):
+        return None
+    return slug
+
+# ═══════════════════════════════════════════════════════
+# FINGERPRINTS & MANIFEST
+# ═══════════════════════════════════════════════════════
+
+def source_digest():
+    """Hash the templates and app code so editing either forces a full rebuild"""
+    paths = list(SOURCE_FILES)
+    for root, _, files in sorted(os.walk(TEMPLATES_DIR)):
+        paths.extend(os.path.join(root, name) for name in sorted(files))
+
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(os.path.relpath(path, os.path.dirname(TEMPLATES_DIR)).encode())
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+def page_digest(data, base_digest):
+    """Hash a page's underlying rows together with the source digest"""
+    payload = json.dumps(data, sort_keys=True, default=str)
+    return hashlib.sha256((base_digest + payload).encode()).hexdigest()
+
+def manifest_path(output_dir):
+    """Path of the manifest for output_dir, outside the served tree"""
+    return os.path.abspath(output_dir).rstrip(os.sep) + MANIFEST_SUFFIX
+
+def load_manifest(output_dir):
+    """Read the manifest left by the previous build (empty if missing)"""
+    try:
+        with open(manifest_path(output_dir)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_manifest(output_dir, manifest):
+    """Write the manifest for the current build"""
+    payload = json.dumps(manifest, indent=2, sort_keys=True)
+    write_atomic(manifest_path(output_dir), payload.encode())
+
+# ═══════════════════════════════════════════════════════
+# BUILD
+# ═══════════════════════════════════════════════════════
+
+def write_atomic(path, content):
+    """Write content to path so readers see either the old or the new file"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = os.path.join(os.path.dirname(path), f'.{os.path.basename(path)}.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+def sync_static(output_dir):
+    """Bring output_dir/static in line with static/, touching only changed files"""
+    target = os.path.join(output_dir, 'static')
+    wanted = set()
+    for root, _, files in os.walk(STATIC_DIR):
+        for name in files:
+            rel_path = os.path.relpath(os.path.join(root, name), STATIC_DIR)
+            wanted.add(rel_path)
+            with open(os.path.join(STATIC_DIR, rel_path), 'rb') as f:
+                content = f.read()
+            out_path = os.path.join(target, rel_path)
+            if os.path.exists(out_path):
+                with open(out_path, 'rb') as f:
+                    if f.read() == content:
+                        continue
+            write_atomic(out_path, content)
+
+    for root, _, files in os.walk(target):
+        for name in files:
+            rel_path = os.path.relpath(os.path.join(root, name), target)
+            if rel_path not in wanted:
+                remove_page(output_dir, os.path.join('static', rel_path))
+
+def remove_page(output_dir, rel_path):
+    """Delete a file from the output tree and any directories it leaves empty"""
+    path = os.path.join(output_dir, rel_path)
+    if not os.path.exists(path):
+        return False
+    os.remove(path)
+    parent = os.path.dirname(rel_path)
+    while parent and not os.listdir(os.path.join(output_dir, parent)):
+        os.rmdir(os.path.join(output_dir, parent))
+        parent = os.path.dirname(parent)
+    return True
+
+def build(output_dir=DEFAULT_OUTPUT, full=False):
+    """Render changed pages into output_dir and return (rendered, skipped, removed)"""
+    os.makedirs(output_dir, exist_ok=True)
+    previous = load_manifest(output_dir)
+    base_digest = source_digest()
+
+    # The query helpers return empty results on failure; building from those
+    # would overwrite good pages with empty listings and delete the rest
+    errors_before = db.query_error_count
+    pages = collect_pages()
+    if db.query_error_count != errors_before:
+        raise RuntimeError("database queries failed while collecting pages; nothing was written")
+
+    manifest = {}
+    rendered = skipped = 0
+
+    # No cookies, so a flash from one page can never leak into the next
+    client = app.test_client(use_cookies=False)
+    flashed = []
+
+    def record_flash(sender, message, category, **extra):
+        flashed.append(message)
+
+    with message_flashed.connected_to(record_flash, app):
+        for url, rel_path, data in pages:
+            digest = page_digest(data, base_digest)
+            out_path = os.path.join(output_dir, rel_path)
+
+            if not full and previous.get(rel_path) == digest and os.path.exists(out_path):
+                manifest[rel_path] = digest
+                skipped += 1
+                continue
+
+            flashed.clear()
+            errors_before = db.query_error_count
+            response = client.get(url)
+            if db.query_error_count != errors_before:
+                flashed.append("database query failed")
+            if response.status_code != 200 or flashed:
+                reason = flashed[0] if flashed else f"HTTP {response.status_code}"
+                print(f"⚠️  Skipping {url}: {reason}")
+                # Keep serving the last good copy until the page renders again
+                if rel_path in previous:
+                    manifest[rel_path] = previous[rel_path]
+                continue
+
+            write_atomic(out_path, response.get_data())
+            manifest[rel_path] = digest
+            rendered += 1
+
+    # Drop pages whose club or category no longer exists
+    current = {rel_path for _, rel_path, _ in pages}
+    removed = 0
+    for rel_path in set(previous) - current:
+        if remove_page(output_dir, rel_path):
+            removed += 1
+
+    sync_static(output_dir)
+    save_manifest(output_dir, manifest)
+    return rendered, skipped, removed
+
+# ═══════════════════════════════════════════════════════
+# MAIN
+# ═══════════════════════════════════════════════════════
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pre-render the read-only pages to static HTML")
+    parser.add_argument('-o', '--output', default=DEFAULT_OUTPUT,
+                        help="output directory (default: ./build)")
+    parser.add_argument('--full', action='store_true',
+                        help="re-render every page instead of only changed ones")
+    args = parser.parse_args(argv)
+
+    print("🏗️  Pre-rendering static pages...")
+    print("=" * 50)
+
+    try:
+        db.init_database()
+        rendered, skipped, removed = build(args.output, full=args.full)
+    except Exception as e:
+        print(f"❌ Build aborted: {e}")
+        raise SystemExit(1)
+
+    print(f"   Rendered: {rendered}")
+    print(f"   Unchanged: {skipped}")
+    print(f"   Removed: {removed}")
+    print(f"\n✅ Static site written to: {os.path.abspath(args.output)}")
+
+if __name__ == '__main__':
+    main()